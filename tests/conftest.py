@@ -1,4 +1,7 @@
 """Pytest configuration and fixtures"""
+from types import MappingProxyType
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 import sys
@@ -10,79 +13,138 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from app import app, activities
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+    """Create a single test client shared across the test session
 
+    Entering the client as a context manager runs the app's startup and
+    shutdown (lifespan) handlers exactly once for the whole session.
+    Redirects are not followed unless a test asks for it explicitly.
+    """
+    with TestClient(app, follow_redirects=False) as test_client:
+        yield test_client
 
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Store original state
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Soccer Team": {
-            "description": "Join the school soccer team and compete in matches",
-            "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 22,
-            "participants": ["lucas@mergington.edu", "mia@mergington.edu"]
-        },
-        "Basketball Club": {
-            "description": "Practice basketball skills and play friendly games",
-            "schedule": "Mondays, 3:30 PM - 5:00 PM",
-            "max_participants": 15,
-            "participants": ["ethan@mergington.edu", "ava@mergington.edu"]
-        },
-        "Art Workshop": {
-            "description": "Explore painting, drawing, and sculpture techniques",
-            "schedule": "Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 18,
-            "participants": ["isabella@mergington.edu", "liam@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Act, direct, and produce school plays and performances",
-            "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 20,
-            "participants": ["noah@mergington.edu", "charlotte@mergington.edu"]
-        },
-        "Mathletes": {
-            "description": "Compete in math competitions and solve challenging problems",
-            "schedule": "Fridays, 4:00 PM - 5:00 PM",
-            "max_participants": 10,
-            "participants": ["oliver@mergington.edu", "amelia@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Conduct experiments and explore scientific concepts",
-            "schedule": "Wednesdays, 3:30 PM - 4:30 PM",
-            "max_participants": 16,
-            "participants": ["elijah@mergington.edu", "harper@mergington.edu"]
-        }
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio only"""
+    return "asyncio"
+
+
+@pytest.fixture
+async def aclient(client, anyio_backend):
+    """Create an async client that calls the app in-process
+
+    ASGITransport does not send lifespan events, so this depends on the
+    session client, which keeps the app's lifespan running meanwhile.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
+
+
+@pytest.fixture(scope="module")
+def activities_snapshot(client):
+    """Fetch GET /activities once per module for read-only invariant checks"""
+    return client.get("/activities").json()
+
+
+def _freeze(activities_data):
+    """Build a read-only view of an activity database"""
+    return MappingProxyType({
+        name: MappingProxyType({**details, "participants": frozenset(details["participants"])})
+        for name, details in activities_data.items()
+    })
+
+
+# Read-only initial state of the in-memory activity database
+_FROZEN_ACTIVITIES = _freeze({
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
+    },
+    "Soccer Team": {
+        "description": "Join the school soccer team and compete in matches",
+        "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
+        "max_participants": 22,
+        "participants": {"lucas@mergington.edu", "mia@mergington.edu"}
+    },
+    "Basketball Club": {
+        "description": "Practice basketball skills and play friendly games",
+        "schedule": "Mondays, 3:30 PM - 5:00 PM",
+        "max_participants": 15,
+        "participants": {"ethan@mergington.edu", "ava@mergington.edu"}
+    },
+    "Art Workshop": {
+        "description": "Explore painting, drawing, and sculpture techniques",
+        "schedule": "Thursdays, 4:00 PM - 5:30 PM",
+        "max_participants": 18,
+        "participants": {"isabella@mergington.edu", "liam@mergington.edu"}
+    },
+    "Drama Club": {
+        "description": "Act, direct, and produce school plays and performances",
+        "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 20,
+        "participants": {"noah@mergington.edu", "charlotte@mergington.edu"}
+    },
+    "Mathletes": {
+        "description": "Compete in math competitions and solve challenging problems",
+        "schedule": "Fridays, 4:00 PM - 5:00 PM",
+        "max_participants": 10,
+        "participants": {"oliver@mergington.edu", "amelia@mergington.edu"}
+    },
+    "Science Club": {
+        "description": "Conduct experiments and explore scientific concepts",
+        "schedule": "Wednesdays, 3:30 PM - 4:30 PM",
+        "max_participants": 16,
+        "participants": {"elijah@mergington.edu", "harper@mergington.edu"}
     }
-    
-    # Reset activities to original state
-    activities.clear()
-    activities.update(original_activities)
-    
+})
+
+
+def _fresh_activity(name):
+    """Build a mutable copy of one baseline activity"""
+    # Only participants are mutable, so a shallow copy is enough; no deepcopy
+    # or JSON round-trip (which could not encode the sets anyway) is needed
+    details = _FROZEN_ACTIVITIES[name]
+    return {**details, "participants": set(details["participants"])}
+
+
+def _restore_activities():
+    """Restore only the activities that differ from the baseline"""
+    if activities.keys() != _FROZEN_ACTIVITIES.keys():
+        # Activities were added or removed; rebuild to keep the baseline order
+        activities.clear()
+        activities.update({name: _fresh_activity(name) for name in _FROZEN_ACTIVITIES})
+        return
+    for name, details in _FROZEN_ACTIVITIES.items():
+        # Compares every field, so in-place participant changes are caught
+        if activities[name] != details:
+            activities[name] = _fresh_activity(name)
+
+
+@pytest.fixture
+def app_state():
+    """Expose the app's in-memory activity database for direct assertions"""
+    return activities
+
+
+@pytest.fixture
+def reset_activities():
+    """Restore activities changed by a mutating test once it finishes"""
     yield
-    
-    # Cleanup after test
-    activities.clear()
-    activities.update(original_activities)
+    _restore_activities()
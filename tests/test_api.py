@@ -1,6 +1,19 @@
 """Test cases for the Mergington High School API endpoints"""
+import asyncio
+from urllib.parse import quote
+
 import pytest
 
+# Activities the app is expected to serve
+EXPECTED_ACTIVITIES = frozenset({
+    "Chess Club", "Programming Class", "Gym Class",
+    "Soccer Team", "Basketball Club", "Art Workshop",
+    "Drama Club", "Mathletes", "Science Club"
+})
+
+# URL-encoded path segment for each activity name
+ENCODED = {name: quote(name) for name in EXPECTED_ACTIVITIES}
+
 
 class TestRootEndpoint:
     """Tests for the root endpoint"""
@@ -31,44 +44,47 @@ class TestGetActivities:
         response = client.get("/activities")
         data = response.json()
         
-        expected_activities = [
-            "Chess Club", "Programming Class", "Gym Class", 
-            "Soccer Team", "Basketball Club", "Art Workshop",
-            "Drama Club", "Mathletes", "Science Club"
-        ]
-        
-        for activity in expected_activities:
+        for activity in EXPECTED_ACTIVITIES:
             assert activity in data
     
-    def test_activity_has_required_fields(self, client):
-        """Test that each activity has all required fields"""
+    @pytest.mark.usefixtures("reset_activities")
+    def test_get_activities_returns_sorted_participants(self, client):
+        """Test that participants are returned as a sorted list after a signup"""
+        email = "newstudent@mergington.edu"
+        client.post(f"/activities/Programming%20Class/signup?email={email}")
+        
         response = client.get("/activities")
         data = response.json()
+        assert data["Programming Class"]["participants"] == [
+            "emma@mergington.edu", email, "sophia@mergington.edu"
+        ]
+    
+    def test_snapshot_covers_only_expected_activities(self, activities_snapshot):
+        """Test that the invariant checks below cover every served activity"""
+        assert set(activities_snapshot) == EXPECTED_ACTIVITIES
+    
+    @pytest.mark.parametrize("activity_name", sorted(EXPECTED_ACTIVITIES))
+    def test_activity_invariants(self, activity_name, activities_snapshot, app_state):
+        """Test that an activity has valid fields and is within capacity"""
+        activity_data = activities_snapshot[activity_name]
         
         required_fields = ["description", "schedule", "max_participants", "participants"]
+        for field in required_fields:
+            assert field in activity_data, f"{activity_name} missing {field}"
         
-        for activity_name, activity_data in data.items():
-            for field in required_fields:
-                assert field in activity_data, f"{activity_name} missing {field}"
-    
-    def test_participants_is_list(self, client):
-        """Test that participants field is a list"""
-        response = client.get("/activities")
-        data = response.json()
+        assert isinstance(activity_data["participants"], list)
+        assert activity_data["participants"] == sorted(app_state[activity_name]["participants"])
         
-        for activity_name, activity_data in data.items():
-            assert isinstance(activity_data["participants"], list)
-    
-    def test_max_participants_is_positive_integer(self, client):
-        """Test that max_participants is a positive integer"""
-        response = client.get("/activities")
-        data = response.json()
+        max_participants = activity_data["max_participants"]
+        assert isinstance(max_participants, int)
+        assert max_participants > 0
         
-        for activity_name, activity_data in data.items():
-            assert isinstance(activity_data["max_participants"], int)
-            assert activity_data["max_participants"] > 0
+        participants_count = len(activity_data["participants"])
+        assert participants_count <= max_participants, \
+            f"{activity_name} has {participants_count} participants but max is {max_participants}"
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestSignupForActivity:
     """Tests for the POST /activities/{activity_name}/signup endpoint"""
     
@@ -84,15 +100,13 @@ class TestSignupForActivity:
         assert "newstudent@mergington.edu" in data["message"]
         assert "Chess Club" in data["message"]
     
-    def test_signup_adds_student_to_participants(self, client):
+    def test_signup_adds_student_to_participants(self, client, app_state):
         """Test that signup actually adds the student to participants list"""
         email = "newstudent@mergington.edu"
         client.post(f"/activities/Programming%20Class/signup?email={email}")
         
         # Verify student was added
-        response = client.get("/activities")
-        data = response.json()
-        assert email in data["Programming Class"]["participants"]
+        assert email in app_state["Programming Class"]["participants"]
     
     def test_signup_duplicate_student_returns_400(self, client):
         """Test that signing up a student twice returns 400 error"""
@@ -118,6 +132,7 @@ class TestSignupForActivity:
         assert response.status_code == 422
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestUnregisterFromActivity:
     """Tests for the DELETE /activities/{activity_name}/unregister endpoint"""
     
@@ -134,15 +149,13 @@ class TestUnregisterFromActivity:
         assert email in data["message"]
         assert "Chess Club" in data["message"]
     
-    def test_unregister_removes_student_from_participants(self, client):
+    def test_unregister_removes_student_from_participants(self, client, app_state):
         """Test that unregister actually removes the student from participants list"""
         email = "michael@mergington.edu"  # Already in Chess Club
         client.delete(f"/activities/Chess%20Club/unregister?email={email}")
         
         # Verify student was removed
-        response = client.get("/activities")
-        data = response.json()
-        assert email not in data["Chess Club"]["participants"]
+        assert email not in app_state["Chess Club"]["participants"]
     
     def test_unregister_non_participant_returns_400(self, client):
         """Test that unregistering a non-participant returns 400 error"""
@@ -168,61 +181,46 @@ class TestUnregisterFromActivity:
         assert response.status_code == 422
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestIntegrationScenarios:
     """Integration tests for common user scenarios"""
     
-    def test_signup_and_unregister_flow(self, client):
+    def test_signup_and_unregister_flow(self, client, app_state):
         """Test complete flow: signup then unregister"""
         email = "testuser@mergington.edu"
         activity = "Chess Club"
         
         # Sign up
         signup_response = client.post(
-            f"/activities/{activity.replace(' ', '%20')}/signup?email={email}"
+            f"/activities/{ENCODED[activity]}/signup?email={email}"
         )
         assert signup_response.status_code == 200
         
         # Verify in list
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data[activity]["participants"]
+        assert email in app_state[activity]["participants"]
         
         # Unregister
         unregister_response = client.delete(
-            f"/activities/{activity.replace(' ', '%20')}/unregister?email={email}"
+            f"/activities/{ENCODED[activity]}/unregister?email={email}"
         )
         assert unregister_response.status_code == 200
         
         # Verify removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data[activity]["participants"]
+        assert email not in app_state[activity]["participants"]
     
-    def test_multiple_signups_different_activities(self, client):
+    @pytest.mark.anyio
+    async def test_multiple_signups_different_activities(self, aclient, app_state):
         """Test that a student can sign up for multiple different activities"""
         email = "multisport@mergington.edu"
         activities_to_join = ["Chess Club", "Programming Class", "Soccer Team"]
         
-        for activity in activities_to_join:
-            response = client.post(
-                f"/activities/{activity.replace(' ', '%20')}/signup?email={email}"
-            )
+        responses = await asyncio.gather(*(
+            aclient.post(f"/activities/{ENCODED[activity]}/signup?email={email}")
+            for activity in activities_to_join
+        ))
+        for response in responses:
             assert response.status_code == 200
         
         # Verify student is in all activities
-        response = client.get("/activities")
-        data = response.json()
-        
         for activity in activities_to_join:
-            assert email in data[activity]["participants"]
-    
-    def test_activity_capacity_not_exceeded(self, client):
-        """Test that participants list doesn't exceed max_participants (informational)"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        for activity_name, activity_data in data.items():
-            participants_count = len(activity_data["participants"])
-            max_participants = activity_data["max_participants"]
-            assert participants_count <= max_participants, \
-                f"{activity_name} has {participants_count} participants but max is {max_participants}"
+            assert email in app_state[activity]["participants"]